@@ -6,7 +6,8 @@ import sys
 import random
 import math
 from typing import List, Optional, Tuple
-from collections import deque
+
+import tabela_final
 
 # ---- Init ----
 pygame.init()
@@ -397,28 +398,6 @@ def selecionar_inicio(tabuleiro: List[List[Optional[int]]], bloqueado: Optional[
         CLOCK.tick(FPS)
 
 # ---- Bot helpers ----
-def count_reachable(tabuleiro: List[List[Optional[int]]], start: Tuple[int,int]) -> int:
-    rows = len(tabuleiro)
-    cols = len(tabuleiro[0])
-    if not (0 <= start[0] < rows and 0 <= start[1] < cols):
-        return 0
-    if tabuleiro[start[0]][start[1]] is not None:
-        return 0
-    visited = [[False]*cols for _ in range(rows)]
-    q = deque()
-    q.append(start)
-    visited[start[0]][start[1]] = True
-    cnt = 0
-    while q:
-        r,c = q.popleft()
-        cnt += 1
-        for dr, dc in KEY_LIST:
-            nr, nc = r+dr, c+dc
-            if 0 <= nr < rows and 0 <= nc < cols and not visited[nr][nc] and tabuleiro[nr][nc] is None:
-                visited[nr][nc] = True
-                q.append((nr,nc))
-    return cnt
-
 def bot_choose_move_easy(tabuleiro, pos):
     moves = list(KEY_LIST)
     random.shuffle(moves)
@@ -428,7 +407,7 @@ def bot_choose_move_easy(tabuleiro, pos):
             return (nr, nc)
     return None
 
-def bot_choose_move_medium(tabuleiro, pos):
+def bot_choose_move_medium(tabuleiro, pos, enemy_pos: Optional[Tuple[int,int]] = None):
     valid_moves = []
     for dr, dc in KEY_LIST:
         nr, nc = pos[0] + dr, pos[1] + dc
@@ -440,9 +419,7 @@ def bot_choose_move_medium(tabuleiro, pos):
         best = None
         best_score = -1
         for nr, nc in valid_moves:
-            tabuleiro[nr][nc] = 1
-            score = count_reachable(tabuleiro, (nr, nc))
-            tabuleiro[nr][nc] = None
+            score = tabela_final.alcance(tabuleiro, (nr, nc), enemy_pos)
             if score > best_score:
                 best_score = score
                 best = (nr, nc)
@@ -475,6 +452,8 @@ def bot_choose_move_hard(tabuleiro, own_pos, enemy_pos, last_player_move: Option
             mirror_target = None
 
     for (nr, nc) in valid_moves:
+        # exact walk for a private pocket, component size otherwise
+        reach = tabela_final.alcance(tabuleiro, (nr, nc), enemy_pos)
         tabuleiro[nr][nc] = 1
 
         own_future = 0
@@ -493,8 +472,6 @@ def bot_choose_move_hard(tabuleiro, own_pos, enemy_pos, last_player_move: Option
             if 0 <= orr < len(tabuleiro) and 0 <= oc < len(tabuleiro[0]) and tabuleiro[orr][oc] is None:
                 opp_moves += 1
 
-        reach = count_reachable(tabuleiro, (nr, nc))
-
         mirror_bonus = 0
         if mirror_target is not None and (nr, nc) == mirror_target:
             mirror_bonus = 1
@@ -512,7 +489,7 @@ def bot_choose_move_hard(tabuleiro, own_pos, enemy_pos, last_player_move: Option
             best = (nr, nc)
 
     if best is None:
-        return bot_choose_move_medium(tabuleiro, own_pos)
+        return bot_choose_move_medium(tabuleiro, own_pos, enemy_pos)
     return best
 
 # ---- Round logic ----
@@ -560,7 +537,7 @@ def jogar_round(vs_bot: bool, score: List[int], bot_level: Optional[int] = None)
                     if bot_level == 0:
                         chosen = bot_choose_move_easy(tabuleiro, pos[1])
                     elif bot_level == 1:
-                        chosen = bot_choose_move_medium(tabuleiro, pos[1])
+                        chosen = bot_choose_move_medium(tabuleiro, pos[1], pos[0])
                     else:
                         chosen = bot_choose_move_hard(tabuleiro, pos[1], pos[0], last_player_move)
                     if chosen:
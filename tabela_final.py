@@ -0,0 +1,252 @@
+# tabela_final.py
+#
+# Endgame tablebase for small enclosed regions.
+#
+# Generate offline with:  python tabela_final.py [max_cells]
+# The game maps tabela_final.bin lazily on the first lookup; if the file is
+# missing, consultar() returns None and the bots fall back to their heuristics.
+
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+TABELA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tabela_final.bin")
+
+# Keys pack (mask << 10) | (entry << 4) | width; the walk length lives in the
+# top byte of each slot. A 12-cell region spans at most 42 bbox cells, so
+# 12 is the largest size that still fits below that byte.
+MAX_CELLS_LIMIT = 12
+DEFAULT_MAX_CELLS = 10
+
+MAGIC = b"GRTB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")  # magic, version, max_cells, n_buckets, n_slots
+KEY_MASK = (1 << 56) - 1
+U64 = (1 << 64) - 1
+
+NEIGHBORS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+SYMMETRIES = (
+    lambda r, c: (r, c),
+    lambda r, c: (r, -c),
+    lambda r, c: (-r, c),
+    lambda r, c: (-r, -c),
+    lambda r, c: (c, r),
+    lambda r, c: (c, -r),
+    lambda r, c: (-c, r),
+    lambda r, c: (-c, -r),
+)
+
+Cell = Tuple[int, int]
+
+# ---- Canonical form ----
+def encode(cells: List[Cell], entry: Cell) -> int:
+    min_r = min(r for r, _ in cells)
+    min_c = min(c for _, c in cells)
+    w = max(c for _, c in cells) - min_c + 1
+    mask = 0
+    for r, c in cells:
+        mask |= 1 << ((r - min_r) * w + (c - min_c))
+    e = (entry[0] - min_r) * w + (entry[1] - min_c)
+    return (mask << 10) | (e << 4) | w
+
+def canonical_key(cells: List[Cell], entry: Cell) -> int:
+    best = None
+    for sym in SYMMETRIES:
+        key = encode([sym(r, c) for r, c in cells], sym(*entry))
+        if best is None or key < best:
+            best = key
+    return best
+
+def canonical_shape(cells) -> FrozenSet[Cell]:
+    best = None
+    for sym in SYMMETRIES:
+        moved = [sym(r, c) for r, c in cells]
+        min_r = min(r for r, _ in moved)
+        min_c = min(c for _, c in moved)
+        norm = tuple(sorted((r - min_r, c - min_c) for r, c in moved))
+        if best is None or norm < best:
+            best = norm
+    return frozenset(best)
+
+# ---- Hashing ----
+def mix(x: int) -> int:
+    # splitmix64 finalizer
+    x = (x + 0x9E3779B97F4A7C15) & U64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & U64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & U64
+    return x ^ (x >> 31)
+
+def slot_of(key: int, seed: int, n_slots: int) -> int:
+    return mix(key ^ ((seed * 0xD6E8FEB86659FD93) & U64)) % n_slots
+
+# ---- Generator ----
+def maior_caminho(cells: List[Cell], entry: Cell) -> int:
+    # Exact longest simple walk starting on `entry`, counted in cells.
+    index = {cell: i for i, cell in enumerate(cells)}
+    adj = [[index[(r + dr, c + dc)] for dr, dc in NEIGHBORS if (r + dr, c + dc) in index]
+           for r, c in cells]
+    best = 0
+
+    def dfs(i: int, visited: int, length: int):
+        nonlocal best
+        if length > best:
+            best = length
+            if best == len(cells):
+                return True
+        for j in adj[i]:
+            if not visited >> j & 1 and dfs(j, visited | (1 << j), length + 1):
+                return True
+        return False
+
+    dfs(index[entry], 1 << index[entry], 1)
+    return best
+
+def enumerar_formas(max_cells: int) -> List[FrozenSet[Cell]]:
+    level = {canonical_shape([(0, 0)])}
+    shapes = list(level)
+    for _ in range(max_cells - 1):
+        nxt = set()
+        for shape in level:
+            for r, c in shape:
+                for dr, dc in NEIGHBORS:
+                    cell = (r + dr, c + dc)
+                    if cell not in shape:
+                        nxt.add(canonical_shape(shape | {cell}))
+        level = nxt
+        shapes.extend(level)
+    return shapes
+
+def gerar_entradas(max_cells: int) -> Dict[int, int]:
+    entries: Dict[int, int] = {}
+    for shape in enumerar_formas(max_cells):
+        cells = sorted(shape)
+        for entry in cells:
+            key = canonical_key(cells, entry)
+            if key not in entries:
+                entries[key] = maior_caminho(cells, entry)
+    return entries
+
+def construir_hash(keys: List[int]) -> Tuple[List[int], List[int]]:
+    # Hash-and-displace: place the largest buckets first, searching a seed
+    # that sends every key of the bucket to a free slot.
+    n_slots = max(1, len(keys) * 10 // 9 + 1)
+    n_buckets = max(1, len(keys) // 4)
+    buckets: List[List[int]] = [[] for _ in range(n_buckets)]
+    for key in keys:
+        buckets[mix(key) % n_buckets].append(key)
+
+    seeds = [0] * n_buckets
+    taken = [False] * n_slots
+    slots = [0] * n_slots
+    for b in sorted(range(n_buckets), key=lambda i: -len(buckets[i])):
+        bucket = buckets[b]
+        if not bucket:
+            break
+        seed = 0
+        while True:
+            pos = [slot_of(key, seed, n_slots) for key in bucket]
+            if len(set(pos)) == len(pos) and not any(taken[p] for p in pos):
+                break
+            seed += 1
+        seeds[b] = seed
+        for key, p in zip(bucket, pos):
+            taken[p] = True
+            slots[p] = key
+    return seeds, slots
+
+def gerar_tabela(max_cells: int = DEFAULT_MAX_CELLS, path: str = TABELA_PATH) -> int:
+    if not 1 <= max_cells <= MAX_CELLS_LIMIT:
+        raise ValueError(f"max_cells must be between 1 and {MAX_CELLS_LIMIT}")
+    entries = gerar_entradas(max_cells)
+    seeds, slots = construir_hash(list(entries))
+    # Write beside the target and swap it in, so an interrupted run or a game
+    # that has the old table mapped never sees a partial file.
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, max_cells, len(seeds), len(slots)))
+        f.write(struct.pack(f"<{len(seeds)}I", *seeds))
+        f.write(struct.pack(f"<{len(slots)}Q", *((entries[k] << 56) | k if k else 0 for k in slots)))
+    os.replace(tmp, path)
+    return len(entries)
+
+# ---- Lookup ----
+class Tabela:
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.max_cells, self.n_buckets, self.n_slots = HEADER.unpack_from(self.data, 0)
+        except struct.error:
+            raise ValueError(f"{path} is too short for a tablebase header")
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} tablebase")
+        self.slots_offset = HEADER.size + 4 * self.n_buckets
+        if not self.n_buckets or not self.n_slots or len(self.data) != self.slots_offset + 8 * self.n_slots:
+            raise ValueError(f"{path} is truncated or corrupt")
+
+    def lookup(self, key: int) -> Optional[int]:
+        (seed,) = struct.unpack_from("<I", self.data, HEADER.size + 4 * (mix(key) % self.n_buckets))
+        (slot,) = struct.unpack_from("<Q", self.data, self.slots_offset + 8 * slot_of(key, seed, self.n_slots))
+        if slot & KEY_MASK != key:
+            return None
+        return slot >> 56
+
+_tabela = None
+
+def carregar_tabela() -> Optional[Tabela]:
+    global _tabela
+    if _tabela is None:
+        try:
+            _tabela = Tabela(TABELA_PATH)
+        except (OSError, ValueError):
+            _tabela = False
+    return _tabela or None
+
+def regiao(tabuleiro: List[List[Optional[int]]], start: Cell, limite: int) -> Optional[List[Cell]]:
+    # Free component around `start` (treated as free), or None past `limite` cells.
+    rows = len(tabuleiro)
+    cols = len(tabuleiro[0])
+    seen = {start}
+    stack = [start]
+    while stack:
+        r, c = stack.pop()
+        for dr, dc in NEIGHBORS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols and (nr, nc) not in seen and tabuleiro[nr][nc] is None:
+                if len(seen) == limite:
+                    return None
+                seen.add((nr, nc))
+                stack.append((nr, nc))
+    return list(seen)
+
+def consultar(tabuleiro: List[List[Optional[int]]], entrada: Cell,
+              inimigo: Optional[Cell] = None) -> Optional[int]:
+    # Longest walk (in cells, entry included) available after stepping onto
+    # `entrada`, or None when its region is too big, the opponent's head
+    # touches it, or no table is present.
+    tabela = carregar_tabela()
+    if tabela is None:
+        return None
+    cells = regiao(tabuleiro, entrada, tabela.max_cells)
+    if cells is None:
+        return None
+    if inimigo is not None and any(abs(r - inimigo[0]) + abs(c - inimigo[1]) == 1 for r, c in cells):
+        return None
+    return tabela.lookup(canonical_key(cells, entrada))
+
+def alcance(tabuleiro: List[List[Optional[int]]], entrada: Cell,
+            inimigo: Optional[Cell] = None) -> int:
+    # Bot reach score for stepping onto the free cell `entrada`: the exact
+    # walk for a private pocket, otherwise the size of its free component.
+    # Both count `entrada` itself, so the two are directly comparable.
+    walk = consultar(tabuleiro, entrada, inimigo)
+    if walk is not None:
+        return walk
+    return len(regiao(tabuleiro, entrada, len(tabuleiro) * len(tabuleiro[0])))
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MAX_CELLS
+    total = gerar_tabela(n)
+    print(f"{total} regions up to {n} cells -> {TABELA_PATH}")
@@ -0,0 +1,82 @@
+# test_tabela_final.py
+
+import pytest
+
+import tabela_final
+
+# 1 = used cell; the 4-cell T pocket in the top-left corner is walled off.
+POCKET = [
+    [None, None, None, 1, None, None, None],
+    [1, None, 1, None, None, None, None],
+    [None, 1, None, None, None, None, None],
+    [None, None, None, None, None, None, None],
+    [None, None, None, None, None, None, None],
+    [None, None, None, None, None, None, None],
+    [None, None, None, None, None, None, None],
+]
+ENTRY = (1, 1)
+
+def rotate(tabuleiro):
+    return [list(row) for row in zip(*tabuleiro[::-1])]
+
+def reflect(tabuleiro):
+    return [row[::-1] for row in tabuleiro]
+
+def rotate_cell(cell, rows):
+    return (cell[1], rows - 1 - cell[0])
+
+def reflect_cell(cell, cols):
+    return (cell[0], cols - 1 - cell[1])
+
+@pytest.fixture
+def tabela(tmp_path, monkeypatch):
+    path = str(tmp_path / "tabela.bin")
+    tabela_final.gerar_tabela(6, path)
+    monkeypatch.setattr(tabela_final, "TABELA_PATH", path)
+    monkeypatch.setattr(tabela_final, "_tabela", None)
+    return path
+
+def test_consultar_matches_maior_caminho_under_symmetry(tabela):
+    boards = [(POCKET, ENTRY)]
+    for _ in range(3):
+        b, cell = boards[-1]
+        boards.append((rotate(b), rotate_cell(cell, len(b))))
+    boards += [(reflect(b), reflect_cell(cell, len(b[0]))) for b, cell in boards]
+
+    for b, entrada in boards:
+        cells = tabela_final.regiao(b, entrada, 6)
+        assert len(cells) == 4
+        assert tabela_final.consultar(b, entrada) == tabela_final.maior_caminho(cells, entrada) == 3
+
+def test_consultar_ignores_large_and_shared_regions(tabela):
+    assert tabela_final.consultar(POCKET, (4, 4)) is None
+    # the opponent's head next to the pocket can contest it
+    assert tabela_final.consultar(POCKET, ENTRY, inimigo=(1, 2)) is None
+    assert tabela_final.consultar(POCKET, ENTRY, inimigo=(5, 5)) == 3
+
+def test_alcance_prefers_open_region_over_pocket(tabela):
+    assert tabela_final.alcance(POCKET, ENTRY) < tabela_final.alcance(POCKET, (2, 2))
+
+def test_consultar_without_table_returns_none(tmp_path, monkeypatch):
+    monkeypatch.setattr(tabela_final, "TABELA_PATH", str(tmp_path / "missing.bin"))
+    monkeypatch.setattr(tabela_final, "_tabela", None)
+    assert tabela_final.consultar(POCKET, ENTRY) is None
+    assert tabela_final.alcance(POCKET, ENTRY) == 4
+
+@pytest.mark.parametrize("size", [10, 100])
+def test_consultar_with_truncated_table_returns_none(tmp_path, monkeypatch, size):
+    path = str(tmp_path / "tabela.bin")
+    tabela_final.gerar_tabela(6, path)
+    with open(path, "rb") as f:
+        data = f.read(size)
+    with open(path, "wb") as f:
+        f.write(data)
+    monkeypatch.setattr(tabela_final, "TABELA_PATH", path)
+    monkeypatch.setattr(tabela_final, "_tabela", None)
+    assert tabela_final.consultar(POCKET, ENTRY) is None
+    assert tabela_final.alcance(POCKET, ENTRY) == 4
+
+def test_gerar_tabela_leaves_no_temp_file(tmp_path):
+    path = tmp_path / "tabela.bin"
+    tabela_final.gerar_tabela(4, str(path))
+    assert [p.name for p in tmp_path.iterdir()] == ["tabela.bin"]